@@ -1,28 +1,28 @@
 import argparse
+import array
+import asyncio
+import bisect
 import configparser
+import contextlib
+import functools
+import heapq
 import json
 import logging
 import os
-import random
+import queue
 import csv
+import email.utils
 import re
+import struct
+import sys
+import threading
 import time
 from datetime import datetime, timedelta
-from urllib.parse import quote, urlparse, urlunparse
+from urllib.parse import quote, urlencode
 
 import requests
-from curl_cffi import requests
-from bs4 import BeautifulSoup
-from dateutil.parser import isoparse
-from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.keys import Keys
+from curl_cffi import requests as curl_requests
+from requests.adapters import HTTPAdapter
 
 # --- Configuration & Logging Setup ---
 
@@ -39,10 +39,26 @@ def setup_logging():
         ]
     )
 
+_CONFIG_CACHE = {}
+
+
 def load_config(filename="config.ini"):
-    """Loads configuration from an INI file."""
+    """Loads configuration from an INI file.
+
+    The parsed config is cached by the file's modification time, so repeated
+    calls on an unchanged file (e.g. every --interval run) skip re-parsing.
+    """
+    try:
+        mtime = os.stat(filename).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    cached = _CONFIG_CACHE.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
     config = configparser.ConfigParser()
     config.read(filename)
+    _CONFIG_CACHE[filename] = (mtime, config)
     return config
 
 
@@ -89,23 +105,571 @@ params = {
     'deliveryMethod': 'local_only',
 }
 
-import requests
+# Search results ship inside the page as JSON ("marketplace_search":{...}),
+# so listings are decoded from there rather than from the rendered markup.
+# The pattern runs over the raw response bytes; only the matching <script>
+# bodies are ever decoded to str.
+_SEARCH_BLOB_RE = re.compile(rb'"marketplace_search":\s*')
+_JSON_DECODER = json.JSONDecoder()
+
+_DURATION_RE = re.compile(r'(\d+|an?)\s*(minute|hour|day|week)s?', re.IGNORECASE)
+_UNIT_SECONDS = {'minute': 60, 'hour': 3600, 'day': 86400, 'week': 604800}
+
+# Upper bound on search pages fetched at the same time.
+MAX_CONCURRENT_FETCHES = 8
+
+# A single keep-alive session so every Slack notification reuses the same
+# pooled connection to hooks.slack.com instead of a fresh TCP+TLS handshake.
+_SLACK_SESSION = requests.Session()
+# Retries are handled by _post_to_slack, so the adapter itself never retries.
+_SLACK_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+# Notifications are posted from a daemon thread so the scrape loop only pays
+# for a queue put, never for the HTTP round-trip to Slack.
+_SLACK_QUEUE = queue.Queue(maxsize=256)
+_SLACK_STOP = object()
+_slack_worker = None
+
+
+def _retry_after_seconds(value, default):
+    """Parses a Retry-After header (delta-seconds or HTTP-date), else ``default``."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(retry_at.tzinfo)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+
+def _post_to_slack(webhook_url, payload, attempts=4):
+    """Posts one payload, backing off exponentially on 429, 5xx and network errors.
+
+    Any other 4xx means the payload or webhook is invalid, so it is logged once
+    and not retried.
+    """
+    delay = 1
+    for attempt in range(attempts):
+        try:
+            response = _SLACK_SESSION.post(webhook_url, json=payload, timeout=10)
+            if response.ok:
+                return
+            if response.status_code != 429 and response.status_code < 500:
+                logging.error(f"Slack rejected the notification with HTTP {response.status_code}: "
+                              f"{response.text[:200]!r}; not retrying.")
+                return
+            logging.warning(f"Slack responded with HTTP {response.status_code} (attempt {attempt + 1}/{attempts}).")
+            delay = _retry_after_seconds(response.headers.get('Retry-After'), delay)
+        except requests.RequestException as e:
+            logging.warning(f"Failed to send Slack notification (attempt {attempt + 1}/{attempts}): {e}")
+        if attempt + 1 < attempts:
+            time.sleep(delay)
+            delay *= 2
+    logging.error("Giving up on Slack notification after repeated failures.")
+
+
+def _drain_slack_queue():
+    while True:
+        item = _SLACK_QUEUE.get()
+        if item is _SLACK_STOP:
+            break
+        # Never let one bad notification kill the worker and strand the queue.
+        try:
+            _post_to_slack(*item)
+        except Exception:
+            logging.exception("Unexpected error while sending a Slack notification.")
+
+
+def send_slack_notification(webhook_url, listing):
+    """Queues a short message about a new listing for the Slack worker thread."""
+    global _slack_worker
+    if _slack_worker is None or not _slack_worker.is_alive():
+        _slack_worker = threading.Thread(target=_drain_slack_queue, name="slack-notifier", daemon=True)
+        _slack_worker.start()
+    payload = {'text': f"New listing: {listing['title']}\n{listing['url']}"}
+    try:
+        _SLACK_QUEUE.put_nowait((webhook_url, payload))
+    except queue.Full:
+        logging.warning(f"Slack queue is full; dropping notification for {listing['url']}.")
+
+
+def stop_slack_notifier(timeout=30):
+    """Sends every queued notification, then stops the worker thread."""
+    global _slack_worker
+    if _slack_worker is None:
+        return
+    try:
+        _SLACK_QUEUE.put(_SLACK_STOP, timeout=timeout)
+    except queue.Full:
+        logging.warning("Slack queue did not drain in time; unsent notifications are dropped.")
+    else:
+        _slack_worker.join(timeout)
+    _slack_worker = None
+
+
+@functools.lru_cache(maxsize=128)
+def search_url(location, term):
+    """Builds the newest-first search URL for one term.
+
+    Cached, so scheduled re-polls of the same terms reuse the encoded URL.
+    """
+    return f'https://www.facebook.com/marketplace/{quote(location)}/search/?{urlencode({**params, "query": term})}'
+
+
+def parse_config_duration(value):
+    """Parses a duration such as "30 minutes", "2 days" or "an hour" into a timedelta."""
+    match = _DURATION_RE.fullmatch(value.strip())
+    if not match:
+        raise ValueError(f"Unrecognised duration: {value!r}")
+    amount, unit = match.groups()
+    count = int(amount) if amount.isdigit() else 1
+    return timedelta(seconds=count * _UNIT_SECONDS[unit.lower()])
+
+
+def is_listing_id(text):
+    """True if ``text`` is a listing ID that fits the 64-bit dedup store."""
+    return text.isascii() and text.isdigit() and int(text) < 1 << 64
+
+
+def _epoch_seconds(value):
+    """Returns ``value`` if it is a usable epoch timestamp in seconds, else None.
+
+    Rejects non-numbers and values datetime cannot represent (e.g. epoch
+    milliseconds), so later conversions of a listing's time cannot raise.
+    """
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return None
+    try:
+        datetime.fromtimestamp(value)
+    except (OverflowError, OSError, ValueError):
+        return None
+    return value
+
+
+def _dig(obj, *keys):
+    """Follows ``keys`` through nested dicts; None if any level is missing or not a dict."""
+    for key in keys:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def extract_listings(page):
+    """Extracts every listing from the search JSON embedded in a results page.
+
+    ``page`` is the raw response body (bytes).
+
+    Returns a list of plain dicts with the keys ``item_id``, ``title``,
+    ``price``, ``location``, ``image_url``, ``url``, ``creation_time`` (epoch
+    seconds, or None) and ``is_shipping_offered``. Each listing is returned
+    once even if the page embeds it in more than one blob.
+    """
+    listings = {}
+    for blob in _SEARCH_BLOB_RE.finditer(page):
+        # JSON escapes "</" inside strings, so the blob ends before </script>.
+        end = page.find(b'</script>', blob.end())
+        segment = page[blob.end():end if end != -1 else len(page)]
+        try:
+            search, _ = _JSON_DECODER.raw_decode(segment.decode('utf-8', 'replace'))
+        except ValueError:
+            continue
+        if not isinstance(search, dict):
+            continue
+        edges = _dig(search, 'feed_units', 'edges')
+        for edge in edges if isinstance(edges, list) else []:
+            # Malformed entries are skipped rather than aborting every term.
+            listing = _dig(edge, 'node', 'listing')
+            if not isinstance(listing, dict):
+                continue
+            # IDs are numeric strings; the dedup store keeps them as 64-bit ints.
+            listing_id = str(listing.get('id') or '')
+            if not is_listing_id(listing_id):
+                continue
+            if listing_id in listings:
+                continue
+            geocode = _dig(listing, 'location', 'reverse_geocode')
+            listings[listing_id] = {
+                'item_id': listing_id,
+                'title': str(listing.get('marketplace_listing_title') or ''),
+                'price': _dig(listing, 'listing_price', 'formatted_amount'),
+                'location': ', '.join(str(part) for part in (_dig(geocode, 'city'), _dig(geocode, 'state')) if part),
+                'image_url': _dig(listing, 'primary_listing_photo', 'image', 'uri'),
+                'url': f"https://www.facebook.com/marketplace/item/{listing_id}/",
+                'creation_time': _epoch_seconds(listing.get('creation_time')),
+                'is_shipping_offered': bool(listing.get('is_shipping_offered')),
+            }
+    return list(listings.values())
+
+
+@functools.lru_cache(maxsize=32)
+def compile_anti_keywords(raw_keywords):
+    """Compiles the comma-separated anti_keywords setting into a single pattern.
+
+    One case-insensitive alternation scans each title once instead of one
+    substring search per keyword, and titles need no lowercased copy.
+    Memoized on the raw setting, so repeated scrapes with the same config skip
+    the split/escape/compile work. Returns None if empty.
+    """
+    anti_keywords = [kw.strip() for kw in raw_keywords.split(',') if kw.strip()]
+    if not anti_keywords:
+        return None
+    return re.compile('|'.join(re.escape(kw) for kw in anti_keywords), re.IGNORECASE)
+
+
+# Deduplication IDs are stored as fixed-width 8-byte big-endian ints in an
+# append-only log next to the configured (legacy, newline-delimited) file.
+_ID_STRUCT = struct.Struct('>Q')
+
+
+def dedup_log_path(filename):
+    """Returns the binary ID log that backs the configured deduplication file."""
+    return os.path.splitext(filename)[0] + '.bin'
+
+
+def _import_text_ids(text_file, log_path):
+    """One-time migration of a newline-delimited ID file into the binary log.
+
+    The log is built in a temporary file and moved into place only once the
+    whole text file has been read, so an interrupted import is retried on the
+    next start instead of leaving a partial log behind.
+    """
+    tmp_path = log_path + '.tmp'
+    skipped = 0
+    try:
+        with open(text_file, encoding='utf-8', errors='replace') as src, open(tmp_path, 'wb') as dst:
+            for line in src:
+                line = line.strip()
+                if not line:
+                    continue
+                if not is_listing_id(line):
+                    skipped += 1
+                    continue
+                dst.write(_ID_STRUCT.pack(int(line)))
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, log_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    if skipped:
+        logging.warning(f"Skipped {skipped} line(s) in {text_file} that are not numeric IDs.")
+    logging.info(f"Imported scraped IDs from {text_file} into {log_path}.")
 
-def scrape_marketplace(search_terms, location, config):
-    url = f'https://www.facebook.com/marketplace/{location}/search/'
-    response = requests.get(url, params=params, cookies=cookies, headers=headers)
-    soup = BeautifulSoup(response.content, 'lxml')
 
-    listings = soup.select('a[href*="/marketplace/item/"]')
-    print(len(listings))
-    for item in listings:
-        href = item.get('href')
-        text = item.get_text(strip=True)
-        print(f"Link: {href} | Text: {text}")
+def load_scraped_ids(filename):
+    """Loads the IDs of listings that were already scraped in earlier runs.
 
+    The binary log is streamed in 64 KiB chunks straight into an array.
+    Sorting it briefly materialises every ID as a Python int, but only once per
+    process, at startup; the result is a sorted ``array('Q')`` (8 bytes per
+    ID) ready for binary search.
+    """
+    log_path = dedup_log_path(filename)
+    if not os.path.exists(log_path) and os.path.exists(filename):
+        _import_text_ids(filename, log_path)
 
+    ids = array.array('Q')
+    if not os.path.exists(log_path):
+        return ids
+    # Drop a trailing partial record left behind by an interrupted write, so
+    # records appended later stay aligned to the 8-byte grid.
+    size = os.path.getsize(log_path)
+    if size % _ID_STRUCT.size:
+        logging.warning(f"Truncating {size % _ID_STRUCT.size} stray byte(s) at the end of {log_path}.")
+        os.truncate(log_path, size - size % _ID_STRUCT.size)
+    with open(log_path, 'rb') as f:
+        while chunk := f.read(1 << 16):
+            ids.frombytes(chunk)
+    if sys.byteorder == 'little':
+        ids.byteswap()
+    return array.array('Q', sorted(ids))
 
 
+class SeenIds:
+    """Membership store for already scraped listing IDs.
+
+    IDs from earlier runs sit in a sorted ``array('Q')`` and are looked up by
+    binary search, which costs 8 bytes per ID instead of a set entry plus an
+    int object. IDs seen during this run go into a small set, since recent
+    duplicates are the common case. New IDs are queued in memory and only
+    appended to the binary log, in one write, by ``flush``/``close``. The
+    owner decides when that is safe (see ``ListingSink.flush``).
+
+    The store is built once per process and kept across scheduled runs;
+    ``merge_recent`` folds each run's IDs into the sorted history.
+    """
+
+    def __init__(self, dedup_file):
+        self.dedup_file = dedup_file
+        # Must run before the log is opened for appending, which creates it.
+        self._history = load_scraped_ids(dedup_file)
+        self._recent = set()
+        self._pending = array.array('Q')
+        self._log = open(dedup_log_path(dedup_file), 'ab')
+
+    def __contains__(self, item_id):
+        if item_id in self._recent:
+            return True
+        i = bisect.bisect_left(self._history, item_id)
+        return i < len(self._history) and self._history[i] == item_id
+
+    def __len__(self):
+        return len(self._history) + len(self._recent)
+
+    def add(self, item_id):
+        """Records ``item_id`` as scraped; returns False if it already was.
+
+        Membership check, insert and queueing for the log happen in one
+        place, so the common new-ID path makes no syscall.
+        """
+        if item_id in self:
+            return False
+        self._recent.add(item_id)
+        self._pending.append(item_id)
+        return True
+
+    def merge_recent(self):
+        """Merges the IDs seen so far into the sorted history.
+
+        Only the (small) recent set is sorted; the history is merged in one
+        linear pass, so the log is never reread between runs.
+        """
+        if self._recent:
+            self._history = array.array('Q', heapq.merge(self._history, sorted(self._recent)))
+            self._recent = set()
+
+    def sync(self):
+        """Flushes queued IDs and fsyncs the log."""
+        self.flush()
+        os.fsync(self._log.fileno())
+
+    def flush(self):
+        """Appends every queued ID to the log in a single write."""
+        if self._pending:
+            if sys.byteorder == 'little':
+                self._pending.byteswap()
+            self._log.write(self._pending.tobytes())
+            self._pending = array.array('Q')
+        self._log.flush()
+
+    def close(self):
+        self.sync()
+        self._log.close()
+
+
+class ListingSink:
+    """Buffered, long-lived writers for the output and deduplication files.
+
+    The files are opened once per scrape instead of once per listing, and rows
+    are flushed to disk every ``flush_every`` listings and on close. ``seen``
+    is the caller's long-lived ``SeenIds``; the sink only decides when its
+    queued IDs are written (see ``flush``) and never closes it.
+    """
+
+    CSV_FIELDS = ['id', 'title', 'price', 'location', 'image_url', 'posted_at', 'url', 'scraped_at']
+
+    def __init__(self, output_file, seen, flush_every=32):
+        self.flush_every = flush_every
+        self.seen = seen
+        self._pending = 0
+        self._csv_writer = None
+
+        self._output = open(output_file, 'a', newline='', encoding='utf-8', buffering=1 << 16)
+
+        if output_file.endswith('.csv'):
+            self._csv_writer = csv.DictWriter(self._output, fieldnames=self.CSV_FIELDS)
+            # An append handle starts at end of file, so position 0 means the
+            # file is new or empty; no separate stat is needed.
+            if self._output.tell() == 0:
+                self._csv_writer.writeheader()
+
+    def mark_new(self, item_id):
+        """Records ``item_id`` as scraped; returns False if it already was."""
+        return self.seen.add(item_id)
+
+    def write(self, record):
+        """Appends one listing to the output file."""
+        if self._csv_writer:
+            self._csv_writer.writerow(record)
+        else:
+            self._output.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        # Output rows go out before their IDs, so a crash can never leave a
+        # listing marked as seen without having been saved.
+        self._output.flush()
+        self.seen.flush()
+        self._pending = 0
+
+    def close(self):
+        """Flushes and fsyncs everything once, rather than per record, then closes."""
+        try:
+            self._output.flush()
+            os.fsync(self._output.fileno())
+            # Same order as flush(): IDs only after the rows they cover.
+            self.seen.sync()
+        finally:
+            self._output.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def create_marketplace_session():
+    """Creates the HTTP session used for every Marketplace request.
+
+    It impersonates Chrome's TLS fingerprint, speaks HTTP/2 so concurrent
+    fetches multiplex over one connection, and carries the headers and cookies
+    once rather than per request. curl decompresses gzip/br bodies itself.
+    max_clients caps the pool of curl handles, which bounds concurrency.
+    """
+    return curl_requests.AsyncSession(
+        impersonate="chrome124",
+        http_version="v2",
+        headers=headers,
+        cookies=cookies,
+        max_clients=MAX_CONCURRENT_FETCHES,
+    )
+
+
+async def fetch_search_pages(session, search_terms, location):
+    """Fetches the results page of every term concurrently.
+
+    Returns a list aligned with ``search_terms`` holding either the page body
+    (bytes) or the exception raised.
+    """
+    async def fetch(term):
+        response = await session.get(search_url(location, term))
+        response.raise_for_status()
+        return response.content
+
+    return await asyncio.gather(*(fetch(term) for term in search_terms), return_exceptions=True)
+
+
+async def scrape_marketplace(session, search_terms, location, config, seen):
+    slack_enabled = config.getboolean('Notifications', 'slack_enabled', fallback=False)
+    slack_webhook_url = config.get('Notifications', 'slack_webhook_url', fallback='')
+    output_file = config.get('Output', 'output_file', fallback='results.jsonl')
+    anti_re = compile_anti_keywords(config.get('Scraper', 'anti_keywords', fallback=''))
+    max_age = parse_config_duration(config.get('Scraper', 'max_listing_age', fallback='1 day'))
+
+    pages = await fetch_search_pages(session, search_terms, location)
+
+    with ListingSink(output_file, seen) as sink:
+        for term, page in zip(search_terms, pages):
+            if isinstance(page, Exception):
+                logging.error(f"Failed to fetch results for '{term}': {page}")
+                continue
+
+            listings = extract_listings(page)
+            if not listings:
+                logging.warning(f"No listings found for '{term}'; the page layout or the session cookies may have changed.")
+            # One timestamp per results page; its listings are processed within seconds.
+            now = datetime.now()
+            scraped_at = now.isoformat(timespec='seconds')
+            oldest_allowed = (now - max_age).timestamp()
+            saved = 0
+            for listing in listings:
+                # Results are requested newest first (sortBy=creation_time_descend),
+                # so once one listing is too old, every listing after it is too.
+                if listing['creation_time'] and listing['creation_time'] < oldest_allowed:
+                    break
+                # Filtered listings are recorded too, so later runs skip them
+                # without filtering them again.
+                if not sink.mark_new(int(listing['item_id'])):
+                    continue
+                if listing['is_shipping_offered']:
+                    continue
+                if anti_re and anti_re.search(listing['title']):
+                    continue
+                # %-style so the message is only formatted when DEBUG is enabled.
+                logging.debug("Link: %s | Text: %s", listing['url'], listing['title'])
+                sink.write({
+                    'id': listing['item_id'],
+                    'title': listing['title'],
+                    'price': listing['price'],
+                    'location': listing['location'],
+                    'image_url': listing['image_url'],
+                    'posted_at': (datetime.fromtimestamp(listing['creation_time']).isoformat(timespec='seconds')
+                                  if listing['creation_time'] else None),
+                    'url': listing['url'],
+                    'scraped_at': scraped_at,
+                })
+                if slack_enabled and slack_webhook_url:
+                    send_slack_notification(slack_webhook_url, listing)
+                saved += 1
+            logging.info(f"'{term}': {len(listings)} listings found, {saved} new saved.")
+
+
+
+
+
+def resolve_targets(config, location, search_term):
+    """Returns the ``(search_terms, location)`` to scrape on one run.
+
+    In 'all' mode both come from config.ini, so with --interval edits to them
+    apply from the next run. Raises ValueError if either is missing.
+    """
+    if location.lower() != 'all':
+        # The search term is a single item, but the scraper expects a list.
+        return [search_term], location
+    search_terms = [term.strip() for term in config.get('Scraper', 'search_terms', fallback='').split(',') if term.strip()]
+    location = config.get('Scraper', 'location', fallback='').strip()
+    if not search_terms or not location:
+        raise ValueError("Scraper[search_terms] and Scraper[location] must be set in config.ini for 'all' mode.")
+    return search_terms, location
+
+
+async def run_scraper(location, search_term, interval):
+    """Runs the scrape once, or every ``interval`` minutes if it is non-zero.
+
+    One Marketplace session is kept open for the life of the process, so
+    repeated runs reuse its warm connections instead of new TLS handshakes.
+    Likewise the store of scraped IDs is loaded once and only reloaded if the
+    configured deduplication file changes.
+    """
+    seen = None
+    try:
+        async with create_marketplace_session() as session:
+            while True:
+                try:
+                    # Picks up edits to config.ini between runs; free when unchanged.
+                    config = load_config()
+                    search_terms, target_location = resolve_targets(config, location, search_term)
+                    dedup_file = config.get('Output', 'deduplication_file', fallback='scraped_ids.txt')
+                    if seen is None or seen.dedup_file != dedup_file:
+                        if seen is not None:
+                            seen.close()
+                            seen = None
+                        seen = SeenIds(dedup_file)
+                    await scrape_marketplace(session, search_terms, target_location, config, seen)
+                except Exception as e:
+                    if not interval:
+                        raise
+                    logging.error(f"Scrape failed, retrying on the next run: {e}", exc_info=True)
+                if not interval:
+                    break
+                if seen is not None:
+                    seen.merge_recent()
+                logging.info(f"Next run in {interval:g} minute(s).")
+                await asyncio.sleep(interval * 60)
+    finally:
+        if seen is not None:
+            seen.close()
+
 
 def main():
     """Main execution block: parses args and runs the scraper."""
@@ -127,38 +691,45 @@ def main():
         nargs='?', # Makes this argument optional
         help="The keyword(s) to search for. Required if location is not 'all'."
     )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0,
+        help="Keep running and repeat the scrape every N minutes in this process (default: run once and exit)."
+    )
     args = parser.parse_args()
+    if args.interval < 0:
+        parser.error("--interval must be zero or a positive number of minutes.")
     
     config = load_config()
-    driver = None
 
     try:
         
         if args.location.lower() == 'all':
             logging.info("Running in 'all' mode, using settings from config.ini.")
-            search_terms = [term.strip() for term in config['Scraper']['search_terms'].split(',')]
-            location = config['Scraper']['location']
-            if not search_terms or not location:
-                logging.critical("Scraper[search_terms] and Scraper[location] must be set in config.ini for 'all' mode.")
+            # Checked up front so a bad config fails fast; run_scraper re-reads
+            # the targets on every run.
+            try:
+                resolve_targets(config, args.location, args.search_term)
+            except ValueError as e:
+                logging.critical(e)
                 sys.exit(1)
-            scrape_marketplace(driver, search_terms, location, config)
 
         else:
             if not args.search_term:
                 parser.error("The 'search_term' argument is required when not using 'all' mode.")
             
             logging.info(f"Running in 'specific' mode for location '{args.location}' and term '{args.search_term}'.")
-            # The search term is a single item, but the function expects a list.
-            search_terms = [args.search_term]
-            location = args.location
-            scrape_marketplace(search_terms, location, config)
+
+        # With --interval the process stays resident, so the HTTP sessions,
+        # compiled patterns and notifier thread are reused across runs instead
+        # of being rebuilt by every cron invocation.
+        asyncio.run(run_scraper(args.location, args.search_term, args.interval))
 
     except Exception as e:
         logging.critical(f"A critical error occurred in the main script: {e}", exc_info=True)
     finally:
-        if driver:
-            driver.quit()
-            logging.info("WebDriver closed.")
+        stop_slack_notifier()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file